@@ -1,13 +1,27 @@
 import argparse
+import ast
+import asyncio
+import bisect
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from coverage import Coverage
-from groq import Groq
+from groq import AsyncGroq
+import hashlib
+from importlib.metadata import PackageNotFoundError, version as installed_version
+from io import StringIO
+import json
 import os
+from packaging.requirements import InvalidRequirement, Requirement
+from pathlib import Path
 import pytest
 from dotenv import load_dotenv
+import httpx
 import logging
-import requests
-from typing import List
-from functools import wraps
+import orjson
+import re
+import subprocess
+from typing import Dict, List, Tuple
+from functools import lru_cache, wraps
 import sys
 import rich
 from rich.console import Console
@@ -45,96 +59,206 @@ def run_with_error_handling(func):
 def run_tests(project_path):
     console.print("[bold green]Running tests...[/bold green]")
     tests_dir = os.path.join(project_path, "tests")
-    return pytest.main(['-v', tests_dir])
+    # Each iteration regenerates tests, so collection state can't be reused
+    # between runs; trim the fixed per-run cost instead by skipping the
+    # last-failed cache plugin and its .pytest_cache writes.
+    return pytest.main(['-v', '-p', 'no:cacheprovider', tests_dir])
+
+@lru_cache(maxsize=None)
+def resolve_src_dir(project_path):
+    # Prefer 'src'; fall back to a directory named after the project. Cached
+    # so the existence probes run once per process, not once per iteration.
+    src_dir = os.path.join(project_path, "src")
+    if os.path.isdir(src_dir):
+        return src_dir
+    src_dir = os.path.join(project_path, os.path.basename(project_path))
+    return src_dir if os.path.isdir(src_dir) else None
+
+# (file count, newest mtime) of src + tests at the last coverage run; if it
+# hasn't moved, the percentage can't have either.
+_coverage_cache = {"signature": None, "percentage": 0}
+
+# file -> covered lines at the last run, for reporting which files gained.
+_covered_lines = {}
+
+def report_coverage_delta(cov):
+    data = cov.get_data()
+    improved = []
+    for file in data.measured_files():
+        lines = set(data.lines(file) or ())
+        if lines - _covered_lines.get(file, set()):
+            improved.append(file)
+        _covered_lines[file] = lines
+    if improved and len(improved) < len(_covered_lines):
+        for file in sorted(improved):
+            console.print(f"[bold green]Coverage improved in {file}[/bold green]")
+
+def coverage_signature(project_path):
+    files = get_source_files(project_path) + \
+        list(iter_python_files(os.path.join(project_path, "tests")))
+    mtimes = [os.path.getmtime(file) for file in files]
+    return (len(files), max(mtimes, default=0.0))
 
 def analyze_coverage(project_path):
     console.print("[bold green]Analyzing coverage...[/bold green]")
-    src_dir = os.path.join(project_path, "src")
-    if not os.path.exists(src_dir):
-        # If 'src' doesn't exist, use the project name as the source directory
-        project_name = os.path.basename(project_path)
-        src_dir = os.path.join(project_path, project_name)
-    
-    if not os.path.exists(src_dir):
+    src_dir = resolve_src_dir(project_path)
+    if src_dir is None:
         console.print(f"[bold red]Source directory not found in {project_path}[/bold red]")
         return 0
 
-    cov = Coverage(source=[src_dir], omit=["*/tests/*"]) # TODO: Add branch coverage
+    signature = coverage_signature(project_path)
+    if signature == _coverage_cache["signature"]:
+        console.print("[bold green]No source or test changes since last run; reusing coverage.[/bold green]")
+        return _coverage_cache["percentage"]
+
+    # data_suffix keeps each iteration's measurements in its own file.
+    cov = Coverage(source=[src_dir], omit=["*/tests/*"], data_suffix=True) # TODO: Add branch coverage
     cov.start()
 
     run_tests(project_path)
 
     cov.stop()
     cov.save()
-    
-    cov.load()
-    coverage_percentage = cov.report()
+
+    # Merge on a non-suffixed instance: combining on the measuring instance
+    # would save the merged data back under a suffix and never write the base
+    # .coverage that analyze_uncovered_parts loads. load() first so earlier
+    # iterations' merged data is kept.
+    base = Coverage(source=[src_dir], omit=["*/tests/*"])
+    base.load()
+    base.combine()
+    base.save()
+    report_coverage_delta(base)
+    # Only the total percentage is consumed; send the per-file table to a
+    # throwaway buffer instead of formatting it onto stdout.
+    coverage_percentage = base.report(file=StringIO(), show_missing=False)
+    _coverage_cache["signature"] = signature
+    _coverage_cache["percentage"] = coverage_percentage
     return coverage_percentage
 
+def iter_python_files(root):
+    # Cheaper than os.walk: scandir entries carry their file type, so no extra
+    # stat per entry, and files stream out without intermediate lists.
+    if not os.path.isdir(root):
+        return
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+# The source tree is stable across iterations (generated tests only land in
+# 'tests/'), so walking it once per process is enough.
+@lru_cache(maxsize=None)
 def get_source_files(project_path):
-    src_dir = os.path.join(project_path, "src")
-    if not os.path.exists(src_dir):
-        # If 'src' doesn't exist, use the project name as the source directory
-        project_name = os.path.basename(project_path)
-        src_dir = os.path.join(project_path, project_name)
-    
-    if not os.path.exists(src_dir):
+    src_dir = resolve_src_dir(project_path)
+    if src_dir is None:
         console.print(f"[bold red]Source directory not found in {project_path}[/bold red]")
         return []
-    source_files = []
-    for root, _, files in os.walk(src_dir):
-        for file in files:
-            if file.endswith('.py'):
-                source_files.append(os.path.join(root, file))
-    return source_files
+    return list(iter_python_files(src_dir))
 
 def get_existing_tests(project_path):
     tests_dir = os.path.join(project_path, "tests")
     existing_tests = []
-    for root, _, files in os.walk(tests_dir):
-        for file in files:
-            if file.startswith("test_") and file.endswith(".py"):
-                with open(os.path.join(root, file), 'r') as f:
-                    existing_tests.append(f.read())
+    for path in iter_python_files(tests_dir):
+        if os.path.basename(path).startswith("test_"):
+            with open(path, 'r') as f:
+                existing_tests.append(f.read())
     return "\n\n".join(existing_tests)
 
 def analyze_uncovered_parts(file, project_path):
     cov = Coverage()
     cov.load()
     
-    with open(file, 'r') as f:
-        lines = f.readlines()
-    
-    uncovered_lines = cov.analysis(file)[2]
-    uncovered_functions = []
-    current_function = None
-    
-    for i, line in enumerate(lines, 1):
-        if line.strip().startswith('def '):
-            current_function = line.strip().split('def ')[1].split('(')[0]
-        if i in uncovered_lines and current_function:
-            uncovered_functions.append(current_function)
-    
-    uncovered_functions = list(set(uncovered_functions))
-    
-    return f"Focus on these uncovered functions: {', '.join(uncovered_functions)}. " \
+    data = Path(file).read_bytes()
+
+    uncovered_lines = set(cov.analysis(file)[2])
+
+    # Map each uncovered line to its enclosing function by bisecting over the
+    # sorted function spans. A single ast.parse gives exact start/end lines;
+    # the regex scan is the fallback for files that don't parse.
+    try:
+        tree = ast.parse(data)
+        func_spans = sorted((node.lineno, node.end_lineno, node.name)
+                            for node in ast.walk(tree)
+                            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)))
+    except SyntaxError:
+        func_spans = [(start, None, name) for start, name in scan_function_starts(data)]
+    start_lines = [start for start, _, _ in func_spans]
+
+    uncovered_functions = set()
+    for line_no in uncovered_lines:
+        # The bisect predecessor may be a nested def whose span has already
+        # ended (e.g. a closure defined above this line); walk back through
+        # the sorted spans until one actually encloses the line.
+        idx = bisect.bisect_right(start_lines, line_no) - 1
+        while idx >= 0:
+            _, end_line, name = func_spans[idx]
+            if end_line is None or line_no <= end_line:
+                uncovered_functions.add(name)
+                break
+            idx -= 1
+
+    return f"Focus on these uncovered functions: {', '.join(sorted(uncovered_functions))}. " \
            f"Pay special attention to edge cases and boundary conditions."
 
+# path -> (mtime, functions), so unchanged files are not re-read every iteration
+_func_cache: Dict[str, Tuple[float, List[str]]] = {}
+
+# One C-level scan over the whole buffer beats splitting and stripping every
+# line in Python.
+DEF_RE = re.compile(rb'^[ \t]*def\s+([A-Za-z_]\w*)\s*\(', re.M)
+
+def scan_functions(data):
+    return [m.group(1).decode() for m in DEF_RE.finditer(data)]
+
+def scan_function_starts(data):
+    # Like scan_functions, but pairs each name with its 1-based line number.
+    func_starts = []
+    pos = 0
+    line_no = 1
+    for m in DEF_RE.finditer(data):
+        line_no += data.count(b'\n', pos, m.start())
+        pos = m.start()
+        func_starts.append((line_no, m.group(1).decode()))
+    return func_starts
+
+def get_file_functions(file):
+    mtime = os.path.getmtime(file)
+    cached = _func_cache.get(file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    functions = scan_functions(Path(file).read_bytes())
+    _func_cache[file] = (mtime, functions)
+    return functions
+
+def warm_func_cache(files):
+    # Reads release the GIL, so a thread pool overlaps the disk latency of
+    # files that missed the mtime cache.
+    stale = [file for file in files
+             if _func_cache.get(file) is None
+             or _func_cache[file][0] != os.path.getmtime(file)]
+    if not stale:
+        return
+    with ThreadPoolExecutor(max_workers=min(32, len(stale))) as executor:
+        list(executor.map(get_file_functions, stale))
+
 def get_project_context(project_path):
     source_files = get_source_files(project_path)
-    
+    warm_func_cache(source_files)
+
     context = f"Project root: {project_path}\n"
     context += f"Source files:\n"
-    
+
     for file in source_files:
         relative_path = os.path.relpath(file, project_path)
-        with open(file, 'r') as f:
-            lines = f.readlines()
-        functions = [line.strip().split('def ')[1].split('(')[0] 
-                     for line in lines if line.strip().startswith('def ')]
+        functions = get_file_functions(file)
         context += f"- {relative_path}:\n"
         context += f"  Functions: {', '.join(functions)}\n"
-    
+
     return context
 
 def get_test_examples():
@@ -156,45 +280,103 @@ def get_test_examples():
     """
 
 def post_process_tests(generated_tests):
-    lines = generated_tests.split('\n')
-    processed_lines = []
-    
-    for line in lines:
-        # Ensure proper indentation
-        line = line.strip()
-        if line.startswith('def test_'):
-            processed_lines.append('\n' + line)
-        else:
-            processed_lines.append('    ' + line)
-        
-        # Add assertions if missing
-        if 'assert' not in line and line.strip() != '':
-            processed_lines.append('    assert False, "Add an assertion here"')
-    
-    # Add import statement if missing
+    # Parse the model output once and keep only imports and test functions
+    # (with their decorators); this preserves indentation, multi-line strings
+    # and parametrize blocks that the old line-by-line rewrite mangled.
+    try:
+        tree = ast.parse(generated_tests)
+    except SyntaxError:
+        # Nothing structural we can do with output that doesn't parse.
+        return generated_tests
+
+    # Single pass: stream kept blocks straight into a StringIO rather than
+    # accumulating per-block strings and joining at the end.
+    lines = generated_tests.splitlines(keepends=True)
+    out = StringIO()
     if 'import pytest' not in generated_tests:
-        processed_lines.insert(0, 'import pytest\n')
-    
-    return '\n'.join(processed_lines)
-
-def generate_tests(project_path, groq_client, model):
+        out.write('import pytest\n')
+
+    for node in tree.body:
+        # Drop only stray top-level prose (bare string/expression statements);
+        # fixtures, helpers, constants and test classes all stay, since the
+        # kept tests depend on them.
+        if isinstance(node, ast.Expr):
+            continue
+        if out.tell():
+            out.write('\n')
+        start = min([node.lineno] + [d.lineno for d in getattr(node, 'decorator_list', [])])
+        out.writelines(lines[start - 1:node.end_lineno])
+        if not lines[node.end_lineno - 1].endswith('\n'):
+            out.write('\n')
+
+    return out.getvalue()
+
+class LLMCache:
+    # On-disk cache of completions keyed by sha256(model + prompt). Only safe
+    # because we request deterministic (temperature=0) completions.
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or os.path.expanduser("~/.autocov/cache")
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, model, prompt):
+        return hashlib.sha256((model + "\0" + prompt).encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, model, prompt):
+        path = self._path(self._key(model, prompt))
+        try:
+            with open(path, 'r') as f:
+                content = json.load(f)["content"]
+        except (OSError, ValueError, KeyError):
+            content = None
+        # Treat an empty cached completion as a miss so a transient empty
+        # response doesn't become a permanent one.
+        if not content:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return content
+
+    def put(self, model, prompt, content):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(self._key(model, prompt))
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"content": content}, f)
+        os.replace(tmp_path, path)
+
+    def print_stats(self):
+        console.print(f"[bold cyan]LLM cache: {self.hits} hits, {self.misses} misses[/bold cyan]")
+
+llm_cache = LLMCache()
+
+MAX_CONCURRENT_REQUESTS = 8
+# Files grouped into one request; amortizes per-request HTTP and queueing cost.
+BATCH_SIZE = 4
+FILE_DELIMITER = "###__FILE__:"
+
+async def generate_tests(project_path, groq_api_key, model):
+    # Built per call: the async client is tied to the running event loop, and
+    # main() starts a fresh loop each iteration.
+    groq_client = AsyncGroq(api_key=groq_api_key)
     source_files = get_source_files(project_path)
     existing_tests = get_existing_tests(project_path)
-    
-    for file in source_files:
-        console.print(f"[bold green]Generating tests for {file}[/bold green]")
-        with open(file, 'r') as f:
-            code = f.read()
-        
-        uncovered_parts = analyze_uncovered_parts(file, project_path)
-        
-        context = get_project_context(project_path)
-        examples = get_test_examples()
-        
-        prompt = f"""
-        Generate pytest tests for the following Python code:
+    # Bound the fan-out so we don't hammer the API, and serialize writes in
+    # case two source files map to the same test file name.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    write_locks = defaultdict(asyncio.Lock)
 
-        {code}
+    # Everything except the code and its uncovered parts is identical for
+    # every file, so build it once; keeping the stable part first (as the
+    # system message) also lines up with provider-side prompt caching.
+    context = get_project_context(project_path)
+    examples = get_test_examples()
+
+    prompt_prefix = f"""
+        You generate pytest tests for Python code.
 
         Project context:
         {context}
@@ -202,63 +384,178 @@ def generate_tests(project_path, groq_client, model):
         Existing tests:
         {existing_tests}
 
-        Focus on these uncovered parts and edge cases:
-        {uncovered_parts}
-
         Use these examples as a guide for writing good tests:
         {examples}
 
         Generate comprehensive tests that cover various scenarios and edge cases.
         """
-        
-        try:
-            response = groq_client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
+
+    async def fetch_completion(prompt_suffix):
+        generated = llm_cache.get(model, prompt_prefix + prompt_suffix)
+        if generated is not None:
+            return generated
+
+        # Stream the completion instead of buffering the full response
+        # object; chunks accumulate as they arrive.
+        parts = []
+        async with semaphore:
+            stream = await groq_client.chat.completions.create(
+                messages=[
+                    {"role": "system", "content": prompt_prefix},
+                    {"role": "user", "content": prompt_suffix},
+                ],
                 model=model,
+                temperature=0,
+                stream=True,
             )
-            
-            generated_tests = response.choices[0].message.content
-            
-            processed_tests = post_process_tests(generated_tests)
-            
-            test_file = f"tests/test_{os.path.basename(file)}"
+            async for chunk in stream:
+                parts.append(chunk.choices[0].delta.content or '')
+
+        generated = ''.join(parts)
+        if generated:
+            llm_cache.put(model, prompt_prefix + prompt_suffix, generated)
+        return generated
+
+    async def write_tests(file, generated_tests):
+        processed_tests = post_process_tests(generated_tests)
+
+        test_file = f"tests/test_{os.path.basename(file)}"
+        async with write_locks[test_file]:
             with open(test_file, 'a') as f:
                 f.write(processed_tests)
-            console.print(f"[bold green]Tests written to {test_file}[/bold green]")
+        console.print(f"[bold green]Tests written to {test_file}[/bold green]")
+
+    def file_section(file):
+        code = Path(file).read_text()
+        uncovered_parts = analyze_uncovered_parts(file, project_path)
+        return f"""
+        {FILE_DELIMITER} {os.path.relpath(file, project_path)}
+
+        {code}
+
+        Focus on these uncovered parts and edge cases:
+        {uncovered_parts}
+        """
+
+    async def generate_for_file(file):
+        console.print(f"[bold green]Generating tests for {file}[/bold green]")
+        prompt_suffix = f"""
+        Generate pytest tests for the following Python code:
+        {file_section(file)}
+        """
+        try:
+            await write_tests(file, await fetch_completion(prompt_suffix))
         except Exception as e:
             console.print(f"[bold red]Error generating tests for {file}: {str(e)}[/bold red]")
 
+    async def generate_for_batch(batch):
+        # One request covers the whole batch; the delimiter lets us split the
+        # answer back out per file.
+        by_relpath = {os.path.relpath(file, project_path): file for file in batch}
+        prompt_suffix = f"""
+        For each of the following files, generate pytest tests. Start the answer
+        for each file with the exact delimiter '{FILE_DELIMITER} <path>' on its
+        own line, using the path given for that file.
+        {''.join(file_section(file) for file in batch)}
+        """
+
+        unanswered = list(batch)
+        try:
+            response = await fetch_completion(prompt_suffix)
+            for part in response.split(FILE_DELIMITER)[1:]:
+                header, _, tests = part.partition('\n')
+                file = by_relpath.get(header.strip())
+                if file is not None and file in unanswered and tests.strip():
+                    await write_tests(file, tests)
+                    unanswered.remove(file)
+        except Exception as e:
+            console.print(f"[bold red]Error generating batched tests: {str(e)}[/bold red]")
+
+        if unanswered:
+            # The model skipped or mislabeled some files; retry those one by one.
+            await asyncio.gather(*(generate_for_file(file) for file in unanswered))
+
+    batches = [source_files[i:i + BATCH_SIZE]
+               for i in range(0, len(source_files), BATCH_SIZE)]
+    await asyncio.gather(*(generate_for_batch(batch) for batch in batches))
+
+def unsatisfied_requirements(requirements_file):
+    # Returns the unsatisfied requirement lines, or None if the file contains
+    # anything that isn't a plain requirement (option lines like '-r'/'-e'/
+    # '--index-url', URLs, ...) — those only make sense to pip when it reads
+    # the file itself, not forwarded as argv tokens.
+    needed = []
+    with open(requirements_file, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('-'):
+                return None
+            try:
+                req = Requirement(line)
+            except InvalidRequirement:
+                return None
+            if req.marker is not None and not req.marker.evaluate():
+                continue
+            try:
+                version = installed_version(req.name)
+            except PackageNotFoundError:
+                needed.append(line)
+                continue
+            if req.specifier and version not in req.specifier:
+                needed.append(line)
+    return needed
+
 def install_dependencies(project_path):
     console.print("[bold green]Installing project dependencies...[/bold green]")
     requirements_file = os.path.join(project_path, "requirements.txt")
     pyproject_file = os.path.join(project_path, "pyproject.toml")
-    
+
     if os.path.exists(requirements_file):
-        os.system(f"pip install -r {requirements_file}")
+        # Only hand pip the requirements that aren't already satisfied, in a
+        # single invocation; on warm runs this skips pip entirely.
+        needed = unsatisfied_requirements(requirements_file)
+        if needed is None:
+            # File uses pip options we can't check locally; let pip read it.
+            subprocess.run([sys.executable, "-m", "pip", "install", "-r", requirements_file], check=True)
+        elif needed:
+            subprocess.run([sys.executable, "-m", "pip", "install", *needed], check=True)
+        else:
+            console.print("[bold green]All dependencies already satisfied.[/bold green]")
     elif os.path.exists(pyproject_file):
-        os.system(f"pip install {project_path}")
+        subprocess.run([sys.executable, "-m", "pip", "install", project_path], check=True)
     else:
         console.print("[bold yellow]No requirements.txt or pyproject.toml found. Skipping dependency installation.[/bold yellow]")
 
+_installed_modules = set()
+
 def install_missing_module(module_name):
+    if module_name in _installed_modules:
+        return
     console.print(f"[bold green]Installing missing module: {module_name}[/bold green]")
     try:
-        import subprocess
         subprocess.check_call([sys.executable, "-m", "pip", "install", module_name])
+        _installed_modules.add(module_name)
         console.print(f"[bold green]Successfully installed {module_name}[/bold green]")
     except subprocess.CalledProcessError as e:
         console.print(f"[bold red]Failed to install {module_name}. Error: {e}[/bold red]")
         raise
 
+# Pooled HTTP/2 client for the Groq REST endpoints: connections are kept
+# alive and multiplexed across any calls added later.
+_http = httpx.Client(http2=True, timeout=30.0)
+
+@lru_cache(maxsize=1)
 def get_available_models(api_key: str) -> List[str]:
     url = "https://api.groq.com/openai/v1/models"
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json"
     }
-    response = requests.get(url, headers=headers)
+    response = _http.get(url, headers=headers)
     if response.status_code == 200:
-        return [model['id'] for model in response.json()['data']]
+        return [model['id'] for model in orjson.loads(response.content)['data']]
     else:
         console.print(f"[bold red]Failed to fetch models: {response.status_code}[/bold red]")
         return []
@@ -297,11 +594,10 @@ def main():
     else:
         model = model
 
-    groq_client = Groq(api_key=groq_api_key)
-
     current_coverage = 0
     iteration = 0
     max_iterations = 5  # Prevent infinite loops
+    tests_pending_coverage = False
 
     with Progress(
         SpinnerColumn(),
@@ -317,6 +613,7 @@ def main():
             try:
                 console.print(f"\n[bold blue]Starting iteration {iteration}[/bold blue]")
                 current_coverage = analyze_coverage(project_path)
+                tests_pending_coverage = False
                 console.print(f"[bold green]Current coverage: {current_coverage}%[/bold green]")
 
                 if current_coverage < coverage_limit:
@@ -329,18 +626,19 @@ def main():
                         break
                     
                     console.print(f"[bold blue]Generating tests for iteration {iteration}...[/bold blue]")
-                    generate_tests(project_path, groq_client, model)
-                    
+                    asyncio.run(generate_tests(project_path, groq_api_key, model))
+                    tests_pending_coverage = True
+
                     console.print(f"[bold green]Tests generated for iteration {iteration}.[/bold green]")
                     user_input = console.input("[bold]Do you want to review the generated tests before running them? (y/n): [/bold]")
                     console.print(f"[italic]User input received: {user_input}[/italic]")
-                    
+
                     if user_input.lower() == 'y':
                         console.print("[yellow]Please review the generated tests in the 'tests' directory.[/yellow]")
                         console.input("[bold]Press Enter when you're ready to continue...[/bold]")
-                    
-                    console.print(f"[bold blue]Running tests for iteration {iteration}...[/bold blue]")
-                    run_tests(project_path)
+
+                    # The new tests run under coverage at the top of the next
+                    # iteration; running them again here doubled pytest time.
                 else:
                     console.print(f"[bold green]Target coverage of {coverage_limit}% reached![/bold green]")
                     break
@@ -350,9 +648,14 @@ def main():
 
             console.print(f"[bold cyan]End of iteration {iteration}[/bold cyan]\n")
 
+        if tests_pending_coverage:
+            # Tests generated in the last iteration haven't been measured yet.
+            current_coverage = analyze_coverage(project_path)
+
         console.print(f"[bold yellow]Maximum iterations reached. Final coverage: {current_coverage}%[/bold yellow]")
     if iteration == max_iterations:
         console.print(f"\n[bold cyan]Final coverage: {current_coverage}%[/bold cyan]")
+    llm_cache.print_stats()
     if current_coverage >= coverage_limit:
         console.print("[bold green]Target coverage reached successfully![/bold green]")
     else: